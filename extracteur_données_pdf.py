@@ -1,7 +1,9 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox, simpledialog
 import pandas as pd
 from docx import Document
+import json
+import math
 import re
 from pathlib import Path
 
@@ -25,6 +27,19 @@ except ImportError:
     SimpleDocTemplate = None
 
 
+# Réglages par défaut de pdfplumber pour la détection des tableaux
+DEFAULT_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3.0,
+    "join_tolerance": 3.0,
+}
+TABLE_STRATEGIES = ["lines", "lines_strict", "text"]
+# Nombre de pages analysées par l'aperçu quand aucune plage n'est saisie
+PREVIEW_PAGE_LIMIT = 5
+TABLE_PROFILES_FILE = Path.home() / ".extracteur_profils_tableaux.json"
+
+
 class UniversalConverterApp:
     def __init__(self, root):
         self.root = root
@@ -33,6 +48,11 @@ class UniversalConverterApp:
         
         self.check_dependencies()
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_close(self):
+        self.close_pdf_layout()
+        self.root.destroy()
     
     def check_dependencies(self):
         """Vérifie que les modules nécessaires sont installés."""
@@ -80,7 +100,7 @@ class UniversalConverterApp:
         self.notebook.add(frame, text="📊 PDF → Excel")
         
         frame.columnconfigure(1, weight=1)
-        frame.rowconfigure(4, weight=1)
+        frame.rowconfigure(5, weight=1)
         
         ttk.Label(frame, text="Extracteur PDF vers Excel", 
                  font=('Arial', 14, 'bold')).grid(row=0, column=0, columnspan=3, pady=10)
@@ -92,18 +112,20 @@ class UniversalConverterApp:
                   command=self.browse_file_pdf_excel).grid(row=1, column=2, pady=5)
         
         ttk.Button(frame, text="Extraire les données", 
-                  command=self.extract_pdf_data).grid(row=2, column=0, columnspan=3, pady=15)
+                  command=self.extract_pdf_data).grid(row=2, column=0, columnspan=3, pady=10)
+        
+        self.setup_table_tuning_frame(frame)
         
         ttk.Label(frame, text="Aperçu des données extraites:", 
-                 font=('Arial', 10, 'bold')).grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=5)
+                 font=('Arial', 10, 'bold')).grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=5)
         
         tree_frame = ttk.Frame(frame)
-        tree_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+        tree_frame.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
         
         vsb = ttk.Scrollbar(tree_frame, orient="vertical")
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal")
         self.pdf_excel_tree = ttk.Treeview(tree_frame, yscrollcommand=vsb.set, 
-                                           xscrollcommand=hsb.set, height=12)
+                                           xscrollcommand=hsb.set, height=8)
         vsb.config(command=self.pdf_excel_tree.yview)
         hsb.config(command=self.pdf_excel_tree.xview)
         
@@ -114,9 +136,63 @@ class UniversalConverterApp:
         tree_frame.rowconfigure(0, weight=1)
         
         ttk.Button(frame, text="💾 Exporter vers Excel", 
-                  command=self.export_to_excel).grid(row=5, column=0, columnspan=3, pady=15)
+                  command=self.export_to_excel).grid(row=6, column=0, columnspan=3, pady=10)
         
         self.pdf_excel_df = None
+        self.pdf_excel_source = None  # (fichier, réglages) ayant produit pdf_excel_df
+        self.pdf_layout_cache = None
+        self.table_preview_job = None
+    
+    def setup_table_tuning_frame(self, frame):
+        """Réglages de détection des tableaux, profils et traitement par lot."""
+        tuning_frame = ttk.LabelFrame(frame, text="Réglage des tableaux", padding="10")
+        tuning_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
+        
+        self.vertical_strategy_var = tk.StringVar(value=DEFAULT_TABLE_SETTINGS["vertical_strategy"])
+        self.horizontal_strategy_var = tk.StringVar(value=DEFAULT_TABLE_SETTINGS["horizontal_strategy"])
+        self.snap_tolerance_var = tk.DoubleVar(value=DEFAULT_TABLE_SETTINGS["snap_tolerance"])
+        self.join_tolerance_var = tk.DoubleVar(value=DEFAULT_TABLE_SETTINGS["join_tolerance"])
+        self.preview_pages_var = tk.StringVar()
+        self.auto_preview_var = tk.BooleanVar(value=True)
+        self.table_profile_var = tk.StringVar()
+        
+        ttk.Label(tuning_frame, text="Stratégie verticale:").grid(row=0, column=0, sticky=tk.W, padx=5)
+        ttk.Combobox(tuning_frame, textvariable=self.vertical_strategy_var, values=TABLE_STRATEGIES,
+                     state="readonly", width=12).grid(row=0, column=1, sticky=tk.W, padx=5)
+        ttk.Label(tuning_frame, text="Stratégie horizontale:").grid(row=0, column=2, sticky=tk.W, padx=5)
+        ttk.Combobox(tuning_frame, textvariable=self.horizontal_strategy_var, values=TABLE_STRATEGIES,
+                     state="readonly", width=12).grid(row=0, column=3, sticky=tk.W, padx=5)
+        ttk.Label(tuning_frame, text=f"Pages (aperçu, {PREVIEW_PAGE_LIMIT} par défaut):").grid(
+            row=0, column=4, sticky=tk.W, padx=5)
+        ttk.Entry(tuning_frame, textvariable=self.preview_pages_var,
+                  width=12).grid(row=0, column=5, sticky=tk.W, padx=5)
+        
+        ttk.Label(tuning_frame, text="Tolérance snap:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        ttk.Spinbox(tuning_frame, textvariable=self.snap_tolerance_var, from_=0, to=50,
+                    increment=0.5, width=8).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(tuning_frame, text="Tolérance join:").grid(row=1, column=2, sticky=tk.W, padx=5, pady=5)
+        ttk.Spinbox(tuning_frame, textvariable=self.join_tolerance_var, from_=0, to=50,
+                    increment=0.5, width=8).grid(row=1, column=3, sticky=tk.W, padx=5, pady=5)
+        ttk.Checkbutton(tuning_frame, text="Aperçu automatique",
+                        variable=self.auto_preview_var).grid(row=1, column=4, sticky=tk.W, padx=5)
+        ttk.Button(tuning_frame, text="🔄 Actualiser l'aperçu",
+                   command=self.preview_tables).grid(row=1, column=5, sticky=tk.W, padx=5)
+        
+        ttk.Label(tuning_frame, text="Profil:").grid(row=2, column=0, sticky=tk.W, padx=5)
+        self.table_profile_combo = ttk.Combobox(tuning_frame, textvariable=self.table_profile_var,
+                                                state="readonly", width=20)
+        self.table_profile_combo.grid(row=2, column=1, columnspan=2, sticky=tk.W, padx=5)
+        self.table_profile_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_table_profile())
+        ttk.Button(tuning_frame, text="💾 Enregistrer le profil",
+                   command=self.save_table_profile).grid(row=2, column=3, sticky=tk.W, padx=5)
+        ttk.Button(tuning_frame, text="📂 Traitement par lot",
+                   command=self.batch_extract_pdfs).grid(row=2, column=4, columnspan=2, sticky=tk.W, padx=5)
+        
+        for var in (self.vertical_strategy_var, self.horizontal_strategy_var,
+                    self.snap_tolerance_var, self.join_tolerance_var, self.preview_pages_var):
+            var.trace_add("write", lambda *args: self.schedule_table_preview())
+        
+        self.refresh_table_profiles()
     
     # ==================== EXCEL → PDF ====================
     def setup_excel_to_pdf_tab(self):
@@ -251,40 +327,112 @@ class UniversalConverterApp:
         if filename:
             self.pdf_excel_entry.delete(0, tk.END)
             self.pdf_excel_entry.insert(0, filename)
+            self.close_pdf_layout()
             self.status_label.config(text=f"Fichier: {Path(filename).name}")
     
-    def extract_text_pdfplumber(self, pdf_path):
-        """Retourne le texte brut du PDF."""
-        texts = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                try:
-                    texts.append(page.extract_text() or "")
-                except:
-                    texts.append("")
-        return "\n\n".join(texts)
+    def extract_page_text(self, page):
+        try:
+            return page.extract_text() or ""
+        except:
+            return ""
 
-    def extract_tables_pdfplumber(self, pdf_path):
-        """Retourne une liste de DataFrames extraits comme tableaux."""
+    def extract_page_tables(self, page, table_settings):
+        try:
+            return page.extract_tables(table_settings)
+        except:
+            return []
+
+    def get_pdf_layout(self, pdf_path):
+        """Ouvre le PDF une seule fois et le garde ouvert pour le réglage des tableaux.
+        
+        pdfplumber conserve sur chaque page les caractères, lignes et rectangles
+        déjà lus : tant que le fichier reste ouvert, relancer la détection des
+        tableaux avec d'autres réglages ne ré-analyse pas le PDF. Les pages ne
+        sont analysées qu'à leur première utilisation.
+        """
+        mtime = Path(pdf_path).stat().st_mtime
+        cache = self.pdf_layout_cache
+        if cache is not None and cache["path"] == pdf_path and cache["mtime"] == mtime:
+            return cache
+        
+        self.close_pdf_layout()
+        pdf = pdfplumber.open(pdf_path)
+        try:
+            page_count = len(pdf.pages)
+        except:
+            pdf.close()
+            raise
+        self.pdf_layout_cache = {
+            "path": pdf_path,
+            "mtime": mtime,
+            "pdf": pdf,
+            "page_count": page_count,
+            "texts": {},   # numéro de page -> texte
+            "tables": {},  # (numéro de page, réglages) -> tableaux bruts
+        }
+        return self.pdf_layout_cache
+
+    def close_pdf_layout(self):
+        if self.pdf_layout_cache is not None:
+            try:
+                self.pdf_layout_cache["pdf"].close()
+            except:
+                pass
+            self.pdf_layout_cache = None
+
+    def extract_pdf_pages(self, pdf, table_settings, pages=None, texts=None, tables=None):
+        """Retourne le texte et les tableaux (DataFrames) des pages d'un PDF ouvert.
+        
+        `texts` et `tables` sont des caches optionnels, remplis au fur et à mesure :
+        numéro de page -> texte, (numéro de page, réglages) -> tableaux bruts.
+        """
+        if pages is None:
+            pages = range(1, len(pdf.pages) + 1)
+        texts = {} if texts is None else texts
+        tables = {} if tables is None else tables
+        settings_key = tuple(sorted(table_settings.items()))
+        
+        page_texts = []
         dfs = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for pageno, page in enumerate(pdf.pages, start=1):
-                try:
-                    tables = page.extract_tables()
-                except:
-                    tables = []
-                for t in tables:
-                    if not t:
-                        continue
-                    header = t[0]
-                    rows = t[1:]
-                    cleaned = [[cell if cell is not None else "" for cell in row] for row in rows]
-                    try:
-                        df = pd.DataFrame(cleaned, columns=header)
-                    except:
-                        df = pd.DataFrame(cleaned)
-                    df["_source_page"] = pageno
-                    dfs.append(df)
+        for pageno in pages:
+            page = pdf.pages[pageno - 1]
+            if pageno not in texts:
+                texts[pageno] = self.extract_page_text(page)
+            key = (pageno, settings_key)
+            if key not in tables:
+                tables[key] = self.extract_page_tables(page, table_settings)
+            page_texts.append(texts[pageno])
+            dfs.extend(self.tables_to_dataframes(tables[key], pageno))
+        return "\n\n".join(page_texts), dfs
+
+    def extract_cached_pages(self, pdf_path, table_settings, pages=None):
+        """Comme extract_pdf_pages, sur le PDF gardé ouvert et ses caches.
+        
+        Une extraction complète ne garde en mémoire que les tableaux des
+        réglages courants.
+        """
+        layout = self.get_pdf_layout(pdf_path)
+        if pages is None:
+            settings_key = tuple(sorted(table_settings.items()))
+            for key in [k for k in layout["tables"] if k[1] != settings_key]:
+                del layout["tables"][key]
+        return self.extract_pdf_pages(layout["pdf"], table_settings, pages,
+                                      layout["texts"], layout["tables"])
+
+    def tables_to_dataframes(self, tables, pageno):
+        dfs = []
+        for t in tables:
+            if not t:
+                continue
+            header = t[0]
+            rows = t[1:]
+            cleaned = [[cell if cell is not None else "" for cell in row] for row in rows]
+            try:
+                df = pd.DataFrame(cleaned, columns=header)
+            except:
+                df = pd.DataFrame(cleaned)
+            df["_source_page"] = pageno
+            dfs.append(df)
         return dfs
 
     def parse_key_values(self, text):
@@ -299,6 +447,31 @@ class UniversalConverterApp:
                 kv[key] = kv.get(key, "") + (" | " + val if key in kv else val)
         return kv
 
+    def build_result_dataframe(self, text, tables):
+        """Assemble tableaux, paires clé/valeur ou texte brut en un DataFrame."""
+        # Si on a des tableaux
+        if tables:
+            try:
+                df = pd.concat(tables, ignore_index=True, sort=False)
+            except ValueError:
+                df = pd.DataFrame()
+                for t in tables:
+                    df = pd.concat([df, t], ignore_index=True, sort=False)
+            df["raw_text"] = text
+            cols = [c for c in df.columns if c != "raw_text"] + ["raw_text"]
+            return df[cols].reset_index(drop=True)
+        
+        # Sinon chercher des paires clé:valeur
+        kv = self.parse_key_values(text)
+        if kv:
+            df = pd.DataFrame([kv])
+            df["raw_text"] = text
+            cols = [c for c in df.columns if c != "raw_text"] + ["raw_text"]
+            return df[cols].reset_index(drop=True)
+        
+        # Fallback: texte brut
+        return pd.DataFrame([{"raw_text": text}])
+
     def extract_pdf_data(self):
         pdf_path = self.pdf_excel_entry.get()
         if not pdf_path:
@@ -309,45 +482,58 @@ class UniversalConverterApp:
             messagebox.showerror("Erreur", "pdfplumber n'est pas installé")
             return
         
+        table_settings = self.get_table_settings(interactive=True)
+        if table_settings is None:
+            return
+        
         try:
-            self.status_label.config(text="Extraction en cours...")
-            self.root.update()
-            
-            text = self.extract_text_pdfplumber(pdf_path)
-            tables = self.extract_tables_pdfplumber(pdf_path)
-            
-            # Si on a des tableaux
-            if tables:
-                try:
-                    df = pd.concat(tables, ignore_index=True, sort=False)
-                except ValueError:
-                    df = pd.DataFrame()
-                    for t in tables:
-                        df = pd.concat([df, t], ignore_index=True, sort=False)
-                df["raw_text"] = text
-                cols = [c for c in df.columns if c != "raw_text"] + ["raw_text"]
-                self.pdf_excel_df = df[cols].reset_index(drop=True)
-            else:
-                # Sinon chercher des paires clé:valeur
-                kv = self.parse_key_values(text)
-                if kv:
-                    df = pd.DataFrame([kv])
-                    df["raw_text"] = text
-                    cols = [c for c in df.columns if c != "raw_text"] + ["raw_text"]
-                    self.pdf_excel_df = df[cols].reset_index(drop=True)
-                else:
-                    # Fallback: texte brut
-                    self.pdf_excel_df = pd.DataFrame([{"raw_text": text}])
-            
-            self.display_dataframe(self.pdf_excel_tree, self.pdf_excel_df)
+            self.run_full_extraction(pdf_path, table_settings)
             self.status_label.config(
                 text=f"Extraction réussie: {len(self.pdf_excel_df)} lignes, {len(self.pdf_excel_df.columns)} colonnes"
             )
         except Exception as e:
             messagebox.showerror("Erreur", f"Extraction échouée: {str(e)}")
             self.status_label.config(text="Erreur lors de l'extraction")
+        finally:
+            # Sans réglage en cours, ne pas garder le fichier ouvert (verrouillé sous Windows)
+            if not self.auto_preview_var.get():
+                self.close_pdf_layout()
+    
+    def run_full_extraction(self, pdf_path, table_settings):
+        """Extrait tout le document et mémorise les réglages utilisés."""
+        self.status_label.config(text="Extraction en cours...")
+        self.root.update()
+        
+        text, tables = self.extract_cached_pages(pdf_path, table_settings)
+        self.pdf_excel_df = self.build_result_dataframe(text, tables)
+        self.pdf_excel_source = (pdf_path, table_settings)
+        self.display_dataframe(self.pdf_excel_tree, self.pdf_excel_df)
     
     def export_to_excel(self):
+        pdf_path = self.pdf_excel_entry.get()
+        table_settings = self.get_table_settings(interactive=True)
+        if table_settings is None:
+            return
+        
+        # Les données exportées doivent correspondre aux réglages affichés
+        if self.pdf_excel_source != (pdf_path, table_settings):
+            if not pdf_path or pdfplumber is None:
+                if self.pdf_excel_df is not None:
+                    messagebox.showwarning("Attention", 
+                        "Les réglages ont changé depuis l'extraction.\n"
+                        "Relancez « Extraire les données » avant d'exporter.")
+                    return
+            else:
+                try:
+                    self.run_full_extraction(pdf_path, table_settings)
+                except Exception as e:
+                    messagebox.showerror("Erreur", f"Extraction échouée: {str(e)}")
+                    self.status_label.config(text="Erreur lors de l'extraction")
+                    return
+                finally:
+                    if not self.auto_preview_var.get():
+                        self.close_pdf_layout()
+        
         if self.pdf_excel_df is None or self.pdf_excel_df.empty:
             messagebox.showwarning("Attention", "Aucune donnée à exporter")
             return
@@ -367,6 +553,238 @@ class UniversalConverterApp:
             except Exception as e:
                 messagebox.showerror("Erreur", f"Export échoué: {str(e)}")
     
+    # ==================== RÉGLAGE DES TABLEAUX ====================
+    def get_table_settings(self, interactive=False):
+        """Retourne les réglages pdfplumber saisis, ou None s'ils sont invalides."""
+        try:
+            snap = float(self.snap_tolerance_var.get())
+            join = float(self.join_tolerance_var.get())
+        except (tk.TclError, ValueError):
+            snap = join = None
+        if not (self.is_valid_tolerance(snap) and self.is_valid_tolerance(join)):
+            if interactive:
+                messagebox.showwarning("Attention", "Les tolérances snap et join doivent être des nombres positifs")
+            self.status_label.config(text="Tolérances invalides")
+            return None
+        return {
+            "vertical_strategy": self.vertical_strategy_var.get(),
+            "horizontal_strategy": self.horizontal_strategy_var.get(),
+            "snap_tolerance": snap,
+            "join_tolerance": join,
+        }
+
+    def is_valid_tolerance(self, value):
+        return isinstance(value, float) and math.isfinite(value) and value >= 0
+
+    def parse_page_range(self, spec, page_count):
+        """Convertit '1-3, 7' en liste de numéros de page (vide = premières pages).
+        
+        Lève ValueError si la plage est mal formée, inversée ou hors du document.
+        """
+        if not spec.strip():
+            return list(range(1, min(PREVIEW_PAGE_LIMIT, page_count) + 1))
+        pages = []
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                first, last = part.split("-", 1)
+                first, last = int(first), int(last)
+                if first > last:
+                    raise ValueError(f"Plage inversée: {part}")
+                # Borner avant de construire la plage (saisie en cours, ex: 1-999999999)
+                pages.extend(range(max(1, first), min(last, page_count) + 1))
+            else:
+                pages.append(int(part))
+        pages = [p for p in dict.fromkeys(pages) if 1 <= p <= page_count]
+        if not pages:
+            raise ValueError(f"Aucune page valide dans: {spec}")
+        return pages
+
+    def schedule_table_preview(self):
+        """Relance l'aperçu peu après la dernière modification d'un réglage."""
+        if not self.auto_preview_var.get():
+            return
+        # Rouvrir le PDF sélectionné s'il a été fermé entre-temps
+        if self.pdf_layout_cache is None and not self.pdf_excel_entry.get():
+            return
+        if self.table_preview_job is not None:
+            self.root.after_cancel(self.table_preview_job)
+        self.table_preview_job = self.root.after(300, lambda: self.preview_tables(interactive=False))
+
+    def preview_tables(self, interactive=True):
+        """Relance la détection des tableaux sur quelques pages du PDF gardé ouvert.
+        
+        L'export relance l'extraction complète si les réglages ont changé.
+        """
+        self.table_preview_job = None
+        pdf_path = self.pdf_excel_entry.get()
+        if not pdf_path:
+            if interactive:
+                messagebox.showwarning("Attention", "Sélectionnez un fichier PDF")
+            return
+        
+        if pdfplumber is None:
+            messagebox.showerror("Erreur", "pdfplumber n'est pas installé")
+            return
+        
+        table_settings = self.get_table_settings(interactive)
+        if table_settings is None:
+            return
+        
+        try:
+            layout = self.get_pdf_layout(pdf_path)
+            spec = self.preview_pages_var.get()
+            try:
+                pages = self.parse_page_range(spec, layout["page_count"])
+            except ValueError:
+                if interactive:
+                    messagebox.showwarning("Attention", "Plage de pages invalide (ex: 1-3, 7)")
+                self.status_label.config(text="Plage de pages invalide")
+                return
+            
+            text, tables = self.extract_cached_pages(pdf_path, table_settings, pages)
+            self.display_dataframe(self.pdf_excel_tree, self.build_result_dataframe(text, tables))
+            
+            if not spec.strip():
+                scope = f"{len(pages)} première(s) page(s) sur {layout['page_count']}"
+            else:
+                scope = f"{len(pages)} page(s) sur {layout['page_count']}"
+            self.status_label.config(
+                text=f"Aperçu: {len(tables)} tableau(x), {scope} — "
+                     f"l'export porte sur tout le document avec ces réglages"
+            )
+        except Exception as e:
+            if interactive:
+                messagebox.showerror("Erreur", f"Aperçu échoué: {str(e)}")
+            self.status_label.config(text=f"Erreur lors de l'aperçu: {str(e)}")
+
+    def validate_table_profile(self, profile):
+        """Retourne les réglages complets d'un profil, ou None s'il est invalide."""
+        if not isinstance(profile, dict):
+            return None
+        settings = {**DEFAULT_TABLE_SETTINGS, **profile}
+        if (settings["vertical_strategy"] not in TABLE_STRATEGIES
+                or settings["horizontal_strategy"] not in TABLE_STRATEGIES):
+            return None
+        try:
+            settings["snap_tolerance"] = float(settings["snap_tolerance"])
+            settings["join_tolerance"] = float(settings["join_tolerance"])
+        except (TypeError, ValueError):
+            return None
+        if not (self.is_valid_tolerance(settings["snap_tolerance"])
+                and self.is_valid_tolerance(settings["join_tolerance"])):
+            return None
+        return {key: settings[key] for key in DEFAULT_TABLE_SETTINGS}
+
+    def read_table_profiles_file(self):
+        """Retourne le contenu brut du fichier de profils, ou None s'il est illisible."""
+        if not TABLE_PROFILES_FILE.exists():
+            return {}
+        try:
+            with open(TABLE_PROFILES_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def load_table_profiles(self):
+        """Charge les profils enregistrés en ignorant ceux qui sont invalides."""
+        data = self.read_table_profiles_file() or {}
+        profiles = {}
+        for name, profile in data.items():
+            settings = self.validate_table_profile(profile)
+            if settings is not None:
+                profiles[name] = settings
+        return profiles
+
+    def refresh_table_profiles(self):
+        self.table_profile_combo["values"] = sorted(self.load_table_profiles())
+
+    def apply_table_profile(self):
+        settings = self.load_table_profiles().get(self.table_profile_var.get())
+        if settings is None:
+            return
+        self.vertical_strategy_var.set(settings["vertical_strategy"])
+        self.horizontal_strategy_var.set(settings["horizontal_strategy"])
+        self.snap_tolerance_var.set(settings["snap_tolerance"])
+        self.join_tolerance_var.set(settings["join_tolerance"])
+        self.status_label.config(text=f"Profil appliqué: {self.table_profile_var.get()}")
+
+    def save_table_profile(self):
+        table_settings = self.get_table_settings(interactive=True)
+        if table_settings is None:
+            return
+        
+        name = simpledialog.askstring("Profil", "Nom du profil (modèle de document):",
+                                      initialvalue=self.table_profile_var.get(), parent=self.root)
+        if not name or not name.strip():
+            return
+        name = name.strip()
+        
+        # Conserver telles quelles les entrées existantes, même invalides
+        profiles = self.read_table_profiles_file()
+        if profiles is None:
+            if not messagebox.askyesno("Profil",
+                    f"Le fichier de profils est illisible:\n{TABLE_PROFILES_FILE}\n\n"
+                    f"Le remplacer par un nouveau fichier ?"):
+                return
+            profiles = {}
+        profiles[name] = table_settings
+        try:
+            with open(TABLE_PROFILES_FILE, "w", encoding="utf-8") as f:
+                json.dump(profiles, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            messagebox.showerror("Erreur", f"Enregistrement échoué: {str(e)}")
+            return
+        
+        self.refresh_table_profiles()
+        self.table_profile_var.set(name)
+        self.status_label.config(text=f"Profil enregistré: {name}")
+
+    def batch_extract_pdfs(self):
+        """Extrait plusieurs PDF vers Excel avec les réglages du profil courant."""
+        if pdfplumber is None:
+            messagebox.showerror("Erreur", "pdfplumber n'est pas installé")
+            return
+        
+        table_settings = self.get_table_settings(interactive=True)
+        if table_settings is None:
+            return
+        
+        filenames = filedialog.askopenfilenames(
+            title="Sélectionner les fichiers PDF",
+            filetypes=[("Fichiers PDF", "*.pdf"), ("Tous", "*.*")]
+        )
+        if not filenames:
+            return
+        
+        output_dir = filedialog.askdirectory(title="Dossier de destination")
+        if not output_dir:
+            return
+        
+        done, errors = 0, []
+        for i, pdf_path in enumerate(filenames, start=1):
+            self.status_label.config(text=f"Traitement par lot: {i}/{len(filenames)} - {Path(pdf_path).name}")
+            self.root.update()
+            try:
+                with pdfplumber.open(pdf_path) as pdf:
+                    text, tables = self.extract_pdf_pages(pdf, table_settings)
+                df = self.build_result_dataframe(text, tables)
+                df.to_excel(Path(output_dir) / f"{Path(pdf_path).stem}.xlsx", index=False, engine='openpyxl')
+                done += 1
+            except Exception as e:
+                errors.append(f"{Path(pdf_path).name}: {str(e)}")
+        
+        message = f"Fichiers exportés: {done}/{len(filenames)}\nDossier: {output_dir}"
+        if errors:
+            message += "\n\nErreurs:\n" + "\n".join(errors)
+            messagebox.showwarning("Traitement par lot", message)
+        else:
+            messagebox.showinfo("Succès", message)
+        self.status_label.config(text=f"Traitement par lot terminé: {done}/{len(filenames)}")
+    
     # ==================== FONCTIONS EXCEL → PDF ====================
     def browse_file_excel_pdf(self):
         filename = filedialog.askopenfilename(